@@ -5,8 +5,12 @@ __version__ = "0.4.0"
 from .result import (
     Err,
     Ok,
+    ok,
+    err,
     Result,
     Matcher,
+    CompiledMatcher,
+    matcher,
     map,
     map_err,
     tap,
@@ -40,8 +44,11 @@ __all__ = [
     # Result types
     "Err",
     "Ok",
+    "ok",
+    "err",
     "Result",
     "Matcher",
+    "CompiledMatcher",
     "Do",
     "DoAsync",
     # Result functions
@@ -54,6 +61,7 @@ __all__ = [
     "and_then_async",
     "Do",
     "match",
+    "matcher",
     # Safe functions
     "safe",
     "safe_async",
@@ -1,5 +1,5 @@
-from abc import ABC
-from typing import Optional, TypeVar, Dict, Callable, Union, NoReturn
+import sys
+from typing import Optional, TypeVar, Dict, Callable, NoReturn, cast
 
 A = TypeVar("A")
 E = TypeVar("E", bound="TaggedError")
@@ -8,7 +8,7 @@ F = TypeVar("F", bound="TaggedError")
 _NOT_SET = object()
 
 
-class TaggedError(ABC, Exception):
+class TaggedError(Exception):
     """Base class for tagged exceptions with cause tracking.
 
     Supports both exception and non-exception causes.
@@ -27,10 +27,7 @@ class TaggedError(ABC, Exception):
     _non_exception_cause: Optional[object]
 
     TAG: str
-
-    @property
-    def tag(self) -> str:
-        return self.TAG
+    tag: str
 
     @property
     def message(self) -> str:
@@ -39,6 +36,10 @@ class TaggedError(ABC, Exception):
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "TAG"):
             panic(f"Subclass {cls.__name__} must define TAG class attribute")
+        # Expose the tag as a plain class attribute so reads skip the
+        # property descriptor protocol; interning lets tag comparisons
+        # and dict lookups hit CPython's pointer-equality fast path
+        cls.tag = sys.intern(cls.TAG)
 
     def __init__(self, message: str, cause: Optional[object] = None) -> None:
         """Initialize tagged error with message and optional cause.
@@ -47,19 +48,25 @@ class TaggedError(ABC, Exception):
             message: Error message.
             cause: Optional cause (exception or any object).
         """
+        # BaseException.__new__ already stored the full ctor-args tuple;
+        # this resets args to (message,) so repr() and pickle see the
+        # same message-only tuple as any stdlib exception
         super().__init__(message)
         self._message = message
 
-        if isinstance(cause, BaseException):
+        # type() membership is a pointer compare; isinstance walks the MRO.
+        # Common exception causes hit the fast path in hot retry loops.
+        if type(cause) in _COMMON_EXC or (
+            cause is not None and isinstance(cause, BaseException)
+        ):
             self._non_exception_cause = _NOT_SET
-            self.__cause__ = cause  # Python's built-in cause chaining
+            # cast: the frozenset membership fast path doesn't narrow
+            # cause the way isinstance does
+            self.__cause__ = cast(BaseException, cause)  # built-in cause chaining
         else:
             self._non_exception_cause = "None" if cause is None else cause
             self.__cause__ = None
 
-    def __getattribute__(self, name: str) -> Union[BaseException, None, object]:
-        return object.__getattribute__(self, name)
-
     @property
     def cause(self) -> Optional[object]:
         """Get the cause (exception or non-exception).
@@ -85,7 +92,7 @@ class TaggedError(ABC, Exception):
         Returns:
             True if value is an Exception.
         """
-        return isinstance(value, Exception)
+        return type(value) in _COMMON_EXC or isinstance(value, Exception)
 
     @staticmethod
     def is_tagged_error(value: object) -> bool:
@@ -97,7 +104,8 @@ class TaggedError(ABC, Exception):
         Returns:
             True if value is a TaggedError instance.
         """
-        return isinstance(value, Exception) and isinstance(value, TaggedError)
+        # TaggedError subclasses Exception, so one isinstance suffices
+        return type(value) in _COMMON_TAGGED_EXC or isinstance(value, TaggedError)
 
     @staticmethod
     def match[A](
@@ -156,6 +164,103 @@ class TaggedError(ABC, Exception):
             return otherwise(error)
         return handler(error)
 
+    @staticmethod
+    def compile_match_partial[A](
+        handlers: Dict[type, Callable[..., A]],
+        otherwise: Callable[..., A],
+    ) -> Callable[["TaggedError"], A]:
+        """Precompiles handlers with fallback into a dispatch function.
+
+        Binds handlers.get once so repeated dispatch skips the attribute
+        lookup match_partial pays per call. Build the matcher once at
+        module init and call it in the hot path.
+
+        Args:
+            handlers: Dict mapping error types to handler functions.
+            otherwise: Fallback handler for unmatched types.
+
+        Returns:
+            Dispatch function for TaggedError instances.
+
+        Example:
+            >>> dispatch = TaggedError.compile_match_partial(
+            ...     {MyError: lambda e: "handled"}, lambda e: "fallback"
+            ... )
+            >>> dispatch(my_error)
+            'handled'
+        """
+        get = handlers.get
+
+        def dispatch(error: "TaggedError") -> A:
+            handler = get(type(error))
+            # Explicit None test: a handler must run even if it would
+            # compare falsy
+            if handler is None:
+                return otherwise(error)
+            return handler(error)
+
+        return dispatch
+
+    @staticmethod
+    def compile_match[A](
+        handlers: Dict[type, Callable[..., A]],
+    ) -> Callable[["TaggedError"], A]:
+        """Precompiles handlers into a single-probe dispatch function.
+
+        Walks every registered TaggedError subclass MRO once at build
+        time, so each dispatch is one dict lookup instead of a per-call
+        resolution. Subclasses defined after compilation are resolved on
+        first sight and cached in the same table.
+
+        Args:
+            handlers: Dict mapping error types to handler functions.
+                A handler registered for a base class also matches its
+                subclasses.
+
+        Returns:
+            Dispatch function for TaggedError instances.
+
+        Raises:
+            ValueError: If dispatched with an error no handler covers.
+
+        Example:
+            >>> dispatch = TaggedError.compile_match({MyError: lambda e: "handled"})
+            >>> dispatch(my_error)
+            'handled'
+        """
+
+        def resolve(error_type: type) -> Callable[..., A] | None:
+            for base in error_type.__mro__:
+                handler = handlers.get(base)
+                if handler is not None:
+                    return handler
+            return None
+
+        table: Dict[type, Callable[..., A]] = {}
+
+        def register(cls: type) -> None:
+            handler = resolve(cls)
+            if handler is not None:
+                table[cls] = handler
+            for subclass in cls.__subclasses__():
+                register(subclass)
+
+        register(TaggedError)
+
+        def dispatch(error: "TaggedError") -> A:
+            error_type = type(error)
+            handler = table.get(error_type)
+            if handler is None:
+                handler = resolve(error_type)
+                if handler is None:
+                    raise ValueError(
+                        f"No handler for error type: {error_type.__name__}"
+                    )
+                table[error_type] = handler
+            return handler(error)
+
+        return dispatch
+
 
 class UnhandledException(TaggedError):
     """Exception wrapper for unhandled exceptions.
@@ -171,14 +276,30 @@ class UnhandledException(TaggedError):
 
     TAG: str = "UnhandledException"
 
+    # Interned once; every lazily-built message shares this prefix object
+    _PREFIX: str = sys.intern("Unhandled exception: ")
+
     def __init__(self, cause: object) -> None:
         """Initialize with cause.
 
         Args:
             cause: The underlying exception or error cause.
         """
-        message = f"Unhandled exception: {cause}"
-        super().__init__(message, cause)
+        # Message formatting is deferred: stringifying the cause is wasted
+        # work when the error travels as a value and is never displayed
+        super().__init__("", cause)
+
+    @property
+    def message(self) -> str:
+        if not self._message:
+            self._message = self._PREFIX + str(self.cause)
+            # Keep the C-level args tuple (used by repr and pickle) in
+            # step with the materialized message
+            self.args = (self._message,)
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class Panic(TaggedError):
@@ -200,6 +321,26 @@ class Panic(TaggedError):
             cause: Optional cause (exception or any object).
         """
         super().__init__(message, cause)
+        # CPython still records __context__ either way; suppression only
+        # keeps it out of the rendered traceback. Only suppress when an
+        # explicit cause was given — a bare panic() inside an except
+        # block should keep showing the triggering exception.
+        if cause is not None:
+            self.__suppress_context__ = True
+
+
+"""
+Exception types seen most often as causes in safe()/safe_async() retry loops.
+Checked by identity before falling back to isinstance.
+"""
+_COMMON_EXC: frozenset[type] = frozenset(
+    (ValueError, TypeError, KeyError, RuntimeError, UnhandledException, Panic)
+)
+
+"""
+TaggedError subclasses shipped by the library, for the is_tagged_error fast path.
+"""
+_COMMON_TAGGED_EXC: frozenset[type] = frozenset((UnhandledException, Panic))
 
 
 def is_panic(value: object) -> bool:
@@ -1,4 +1,5 @@
 from typing import (
+    TYPE_CHECKING,
     Any,
     Awaitable,
     TypeVar,
@@ -14,12 +15,11 @@ from typing import (
     TypedDict,
     TypeAlias,
     NoReturn,
+    final,
     Generator,
     AsyncGenerator,
     Iterable,
 )
-from abc import ABC, abstractmethod
-
 from .error import panic, Panic
 
 
@@ -69,6 +69,44 @@ class Matcher(TypedDict, Generic[A, B, E, F]):
     err: Callable[[E], F]
 
 
+class CompiledMatcher(Generic[A, B, E, F]):
+    """Attribute-based matcher built by matcher().
+
+    Dispatch reads a __slots__ attribute instead of hashing a dict key,
+    which is cheaper when the same matcher is applied many times.
+
+    Args:
+        ok: Handler for Ok values.
+        err: Handler for Err values.
+    """
+
+    __slots__ = ("ok", "err")
+
+    def __init__(self, ok: Callable[[A], B], err: Callable[[E], F]) -> None:
+        self.ok: Callable[[A], B] = ok
+        self.err: Callable[[E], F] = err
+
+
+def matcher(
+    ok: Callable[[T], B], err: Callable[[U], F]
+) -> CompiledMatcher[T, B, U, F]:
+    """Builds a reusable attribute-based matcher for Result.match.
+
+    Args:
+        ok: Handler for Ok values.
+        err: Handler for Err values.
+
+    Returns:
+        CompiledMatcher usable anywhere a Matcher dict is accepted.
+
+    Example:
+        >>> m = matcher(lambda x: x * 2, lambda e: 0)
+        >>> Ok(2).match(m)
+        4
+    """
+    return CompiledMatcher(ok, err)
+
+
 class SerializedOk(TypedDict, Generic[A]):
     """
     A serialized representation of an Ok result
@@ -89,8 +127,13 @@ class SerializedErr(TypedDict, Generic[E]):
 
 SerializedResult: TypeAlias = Union[SerializedOk[A], SerializedErr[E]]
 
+"""
+Valid status discriminators for a serialized Result.
+"""
+_STATUS_SET: frozenset[str] = frozenset(("ok", "err"))
+
 
-class Result(Generic[A, E], ABC):
+class Result(Generic[A, E]):
     """Discriminated union representing operation success or failure.
 
     Result[A, E] is either Ok[A, E] (success with value) or Err[A, E] (failure with error).
@@ -103,41 +146,35 @@ class Result(Generic[A, E], ABC):
 
     __slots__ = ()
 
-    @property
-    @abstractmethod
-    def status(self) -> Literal["ok", "err"]: ...
-
-    @staticmethod
-    def ok(value: T) -> "Ok[T, Never]":
-        """Creates successful result.
-
-        Args:
-            value: Success value.
-
-        Returns:
-            Ok instance.
-
-        Example:
-            >>> Result.ok(42)
-            Ok(42)
-        """
-        return Ok(value)
-
-    @staticmethod
-    def err(value: U) -> "Err[Never, U]":
-        """Creates error result.
-
-        Args:
-            value: Error value.
-
-        Returns:
-            Err instance.
-
-        Example:
-            >>> Result.err("failed")
-            Err('failed')
-        """
-        return Err(value)
+    if TYPE_CHECKING:
+        # Declared read-only so Ok/Err can legally narrow it to their own
+        # literal tag; at runtime each variant stores a plain class
+        # attribute instead.
+        @property
+        def status(self) -> Literal["ok", "err"]: ...
+
+        # Bound to the Ok/Err classes after their bodies below, so at
+        # runtime Result.ok(v) dispatches straight to the constructor
+        # with no staticmethod wrapper frame in between.
+        @staticmethod
+        def ok(value: T) -> "Ok[T, Never]":
+            """Creates successful result.
+
+            Example:
+                >>> Result.ok(42)
+                Ok(42)
+            """
+            ...
+
+        @staticmethod
+        def err(value: U) -> "Err[Never, U]":
+            """Creates error result.
+
+            Example:
+                >>> Result.err("failed")
+                Err('failed')
+            """
+            ...
 
     @staticmethod
     def gen[GenA, GenE](
@@ -330,40 +367,48 @@ class Result(Generic[A, E], ABC):
         """
         return self.status == "err"
 
-    @abstractmethod
-    def map(self, fn: Callable[[A], B]) -> "Result[B, E]": ...
+    # Variant-only operations: Ok/Err override every one of these. The
+    # NotImplementedError bodies make a mis-used bare Result fail loudly
+    # instead of silently returning None.
+    def map(self, fn: Callable[[A], B]) -> "Result[B, E]":
+        raise NotImplementedError
 
-    @abstractmethod
-    def map_err(self, fn: Callable[[E], F]) -> "Result[A, F]": ...
+    def map_chain(self, *fns: Callable[[Any], Any]) -> "Result[Any, E]":
+        raise NotImplementedError
 
-    @abstractmethod
-    def unwrap(self, message: Optional[str] = None) -> Union[A, object] | Never: ...
+    def map_err(self, fn: Callable[[E], F]) -> "Result[A, F]":
+        raise NotImplementedError
 
-    @abstractmethod
-    def unwrap_or(self, fallback: B) -> Union[A, B]: ...
+    def unwrap(self, message: Optional[str] = None) -> Union[A, object] | Never:
+        raise NotImplementedError
 
-    @abstractmethod
-    def unwrap_err(self, message: Optional[str] = None) -> E: ...
+    def unwrap_or(self, fallback: B) -> Union[A, B]:
+        raise NotImplementedError
+
+    def unwrap_err(self, message: Optional[str] = None) -> E:
+        raise NotImplementedError
 
-    @abstractmethod
-    def tap(self, fn: Callable[[A], None]) -> "Result[A, E]": ...
+    def tap(self, fn: Callable[[A], None]) -> "Result[A, E]":
+        raise NotImplementedError
 
-    @abstractmethod
-    async def tap_async(self, fn: Callable[[A], Awaitable[None]]) -> "Result[A, E]": ...
+    async def tap_async(self, fn: Callable[[A], Awaitable[None]]) -> "Result[A, E]":
+        raise NotImplementedError
 
-    @abstractmethod
-    def and_then(self, fn: Callable[[A], "Result[B, F]"]) -> "Result[B, E | F]": ...
+    def and_then(self, fn: Callable[[A], "Result[B, F]"]) -> "Result[B, E | F]":
+        raise NotImplementedError
 
-    @abstractmethod
     async def and_then_async(
         self, fn: Callable[[A], Awaitable["Result[B, F]"]]
-    ) -> "Result[B, E | F]": ...
+    ) -> "Result[B, E | F]":
+        raise NotImplementedError
 
-    @abstractmethod
-    def match(self, cases: Matcher[A, B, E, F]) -> B | F: ...
+    def match(
+        self, cases: "Matcher[A, B, E, F] | CompiledMatcher[A, B, E, F]"
+    ) -> B | F:
+        raise NotImplementedError
 
-    @abstractmethod
-    def serialize(self) -> SerializedResult[A, E]: ...
+    def serialize(self) -> SerializedResult[A, E]:
+        raise NotImplementedError
 
     @staticmethod
     def hydrate(data: object) -> "Result[object, object] | None":
@@ -385,21 +430,22 @@ class Result(Generic[A, E], ABC):
             >>> Result.hydrate({"invalid": "data"})
             None
         """
-
-        def is_serialized_result(d: object) -> bool:
-            if not isinstance(d, dict):
-                return False
-            if "status" not in d or "value" not in d:
-                return False
-            if d["status"] not in ("ok", "err"):
-                return False
-            return True
-
-        if not is_serialized_result(data):
+        if type(data) is not dict:
             return None
 
         serialized = cast(dict[str, object], data)
-        if serialized["status"] == "ok":
+        status = serialized.get("status")
+        # type() guard first: frozenset membership hashes the probe, and
+        # an unhashable status (untrusted input) must mean None, not a
+        # TypeError
+        if (
+            type(status) is not str
+            or status not in _STATUS_SET
+            or "value" not in serialized
+        ):
+            return None
+
+        if status == "ok":
             return Result.ok(serialized["value"])
         else:
             return Result.err(serialized["value"])
@@ -428,23 +474,23 @@ class Result(Generic[A, E], ABC):
             >>> Result.hydrate_as({"status": "ok", "value": "42"}, ok=decode_int, err=str)
             Ok(42)
         """
-
-        def is_result(d: object) -> bool:
-            if not isinstance(d, dict):
-                return False
-            if "status" not in d or "value" not in d:
-                return False
-            if d["status"] not in ("ok", "err"):
-                return False
-            return True
-
-        if not is_result(data):
+        if type(data) is not dict:
             return None
 
         serialized = cast(dict[str, object], data)
+        status = serialized.get("status")
+        # type() guard first: frozenset membership hashes the probe, and
+        # an unhashable status (untrusted input) must mean None, not a
+        # TypeError
+        if (
+            type(status) is not str
+            or status not in _STATUS_SET
+            or "value" not in serialized
+        ):
+            return None
 
         try:
-            if serialized["status"] == "ok":
+            if status == "ok":
                 decoded_value = ok(serialized["value"])
                 return Result.ok(decoded_value)
             else:
@@ -527,6 +573,45 @@ class Result(Generic[A, E], ABC):
                 errs.append(result.unwrap_err())
         return (oks, errs)
 
+    @staticmethod
+    def batch_map[BATCH_A, BATCH_B, BATCH_E](
+        results: Iterable["Result[BATCH_A, BATCH_E]"],
+        fn: Callable[[BATCH_A], BATCH_B],
+    ) -> list["Result[BATCH_B, BATCH_E]"]:
+        """Maps a function over an iterable of Results in one tight loop.
+
+        Equivalent to calling .map(fn) on each element, but the variant
+        dispatch and Panic wrapping happen once for the whole batch instead
+        of once per element. Err values pass through unchanged.
+
+        Args:
+            results: Iterable of Results to transform.
+            fn: Transformation applied to each ok value.
+
+        Returns:
+            List of transformed Results, in input order.
+
+        Raises:
+            Panic: If fn throws.
+
+        Example:
+            >>> Result.batch_map([Ok(1), Err("fail"), Ok(2)], lambda x: x * 10)
+            [Ok(10), Err('fail'), Ok(20)]
+        """
+        out: list[Result[BATCH_B, BATCH_E]] = []
+        append = out.append
+        try:
+            for result in results:
+                if type(result) is Ok:
+                    # cast: type() narrowing erases the Ok parameters
+                    ok_result = cast("Ok[BATCH_A, BATCH_E]", result)
+                    append(Ok(fn(ok_result.value)))
+                else:
+                    append(cast("Result[BATCH_B, BATCH_E]", result))
+        except Exception as e:
+            panic("Result.batch_map failed", e)
+        return out
+
     @staticmethod
     def is_result(value: object) -> bool:
         """Checks if a value is a Result.
@@ -588,6 +673,7 @@ Example:
 type DoAsync[T, E] = AsyncGenerator[Result[Any, E], Any]
 
 
+@final
 class Ok(Result[A, E]):
     """Successful result variant.
 
@@ -605,12 +691,54 @@ class Ok(Result[A, E]):
     __slots__ = ("value",)
     __match_args__ = ("value",)
 
-    def __init__(self, value: A) -> None:
-        self.value: A = value
+    if TYPE_CHECKING:
+
+        @property
+        def status(self) -> Literal["ok"]: ...
+
+    else:
+        status = "ok"
+
+    value: A
+
+    def __class_getitem__(cls, item: object) -> type:
+        # Generic's __class_getitem__ builds a _GenericAlias whose call
+        # tries (and fails, under __slots__) to record __orig_class__ on
+        # every parameterized construction like Ok[int, str](v); returning
+        # the class keeps that off the constructor path
+        return cls
+
+    def __new__(cls, value: A) -> "Ok[A, E]":
+        # Flyweights for the most common payloads (cf. CPython's small-int
+        # cache); Ok is immutable by convention so sharing is safe
+        if cls is Ok:
+            if value is None:
+                return cast("Ok[A, E]", _OK_NONE)
+            if value is True:
+                return cast("Ok[A, E]", _OK_TRUE)
+            if value is False:
+                return cast("Ok[A, E]", _OK_FALSE)
+        # Assigning here instead of in __init__ saves type.__call__ a
+        # second Python frame per construction (object.__init__ accepts
+        # the extra argument because __new__ is overridden)
+        obj = cast("Ok[A, E]", object.__new__(cls))
+        obj.value = value
+        return obj
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_err(self) -> bool:
+        return False
+
+    def __bool__(self) -> Literal[True]:
+        """Ok is always truthy, so `if result:` branches on success.
 
-    @property
-    def status(self) -> Literal["ok"]:
-        return "ok"
+        Example:
+            >>> bool(Ok(42))
+            True
+        """
+        return True
 
     def map(self, fn: Callable[[A], B]) -> "Ok[B, E]":
         """Transforms success value.
@@ -628,7 +756,37 @@ class Ok(Result[A, E]):
             >>> Ok(2).map(lambda x: x * 3)
             Ok(6)
         """
-        return try_or_panic(lambda: Ok(fn(self.value)), "Ok.map failed")
+        try:
+            return Ok(fn(self.value))
+        except Exception as e:
+            panic("Ok.map failed", e)
+
+    def map_chain(self, *fns: Callable[[Any], Any]) -> "Ok[Any, E]":
+        """Applies transformations left to right in one pass.
+
+        Equivalent to chaining .map once per function, but allocates a
+        single Ok for the final value instead of one per step.
+
+        Args:
+            *fns: Transformation functions, applied in order.
+
+        Returns:
+            Ok with the fused transformation result.
+
+        Raises:
+            Panic: If any fn throws.
+
+        Example:
+            >>> Ok(2).map_chain(lambda x: x + 1, lambda x: x * 10)
+            Ok(30)
+        """
+        try:
+            value: Any = self.value
+            for fn in fns:
+                value = fn(value)
+            return Ok(value)
+        except Exception as e:
+            panic("Ok.map_chain failed", e)
 
     def map_err(self, fn: Callable[[E], F]) -> "Ok[A, F]":
         """No-op on Ok, returns self with new phantom error type.
@@ -639,7 +797,8 @@ class Ok(Result[A, E]):
         Returns:
             Self with updated phantom E type.
         """
-        return cast("Ok[A, F]", self)
+        # typing.cast is a runtime call; E is phantom so self is returned as-is
+        return self  # type: ignore[return-value]
 
     def unwrap(self, message: Optional[str] = None) -> A:
         """Extracts value.
@@ -703,7 +862,10 @@ class Ok(Result[A, E]):
             2
             Ok(4)
         """
-        fn(self.value)
+        try:
+            fn(self.value)
+        except Exception as e:
+            panic("Ok.tap failed", e)
         return self
 
     async def tap_async(self, fn: Callable[[A], Awaitable[None]]) -> "Ok[A, E]":
@@ -722,7 +884,10 @@ class Ok(Result[A, E]):
             >>> await Ok(2).tap_async(async_log)
             Ok(2)
         """
-        await fn(self.value)
+        try:
+            await fn(self.value)
+        except Exception as e:
+            panic("Ok.tap_async failed", e)
         return self
 
     def and_then(self, fn: Callable[[A], "Result[B, F]"]) -> "Result[B, E | F]":
@@ -741,7 +906,10 @@ class Ok(Result[A, E]):
             >>> Ok(2).and_then(lambda x: Ok(x * 2) if x > 0 else Err("negative"))
             Ok(4)
         """
-        return try_or_panic(lambda: fn(self.value), "Ok.and_then failed")
+        try:
+            return fn(self.value)
+        except Exception as e:
+            panic("Ok.and_then failed", e)
 
     async def and_then_async(
         self, fn: Callable[[A], Awaitable[Result[B, F]]]
@@ -761,15 +929,18 @@ class Ok(Result[A, E]):
             >>> await Ok(1).and_then_async(async_fetch_data)
             Ok(...)
         """
-        return await try_or_panic_async(
-            lambda: fn(self.value), "Ok.and_then_async failed"
-        )
+        try:
+            return await fn(self.value)
+        except Exception as e:
+            panic("Ok.and_then_async failed", e)
 
-    def match(self, cases: Matcher[A, B, E, F]) -> B | F:
+    def match(
+        self, cases: "Matcher[A, B, E, F] | CompiledMatcher[A, B, E, F]"
+    ) -> B | F:
         """Pattern matches on Result.
 
         Args:
-            cases: Ok and err handlers.
+            cases: Ok and err handlers (Matcher dict or CompiledMatcher).
 
         Returns:
             Result of ok handler.
@@ -781,11 +952,14 @@ class Ok(Result[A, E]):
             >>> Ok(2).match({"ok": lambda x: x * 2, "err": lambda e: 0})
             4
         """
-
-        def call_handler() -> B | F:
-            return cases["ok"](self.value)
-
-        return try_or_panic(call_handler, "Ok.match failed")
+        try:
+            if type(cases) is CompiledMatcher:
+                return cases.ok(self.value)
+            # cast: the identity check above doesn't narrow the union's
+            # other arm for pyright
+            return cast("Matcher[A, B, E, F]", cases)["ok"](self.value)
+        except Exception as e:
+            panic("Ok.match failed", e)
 
     def serialize(self) -> SerializedOk[A]:
         """Converts to plain dict for serialization.
@@ -797,24 +971,44 @@ class Ok(Result[A, E]):
             >>> Ok(42).serialize()
             {'status': 'ok', 'value': 42}
         """
-        return SerializedOk(status="ok", value=self.value)
+        # TypedDict is typing-only; a dict literal skips the kwarg unpacking
+        return {"status": "ok", "value": self.value}
+
+    _TAG_HASH = hash("ok")
 
     def __repr__(self) -> str:
         return f"Ok({self.value!r})"
 
     def __hash__(self) -> int:
-        return hash(("ok", self.value))
+        # XOR with the precomputed tag hash; skips a tuple allocation per call
+        return Ok._TAG_HASH ^ hash(self.value)
 
     def __str__(self) -> str:
         return f"Ok({self.value!r})"
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Ok):
-            return False
-        other_ok = cast("Ok[A, E]", other)
-        return self.value == other_ok.value
+        return self is other or (
+            type(other) is Ok and self.value == cast("Ok[A, E]", other).value
+        )
+
+
+def _intern_ok(value: object) -> "Ok[Any, Any]":
+    # Built with object.__new__ so the flyweight lookup in Ok.__new__ is
+    # bypassed while the shared instances are being created
+    ok = cast("Ok[Any, Any]", object.__new__(Ok))
+    ok.value = value
+    return ok
 
 
+"""
+Shared flyweight instances for the most common Ok payloads.
+"""
+_OK_NONE = _intern_ok(None)
+_OK_TRUE = _intern_ok(True)
+_OK_FALSE = _intern_ok(False)
+
+
+@final
 class Err(Result[A, E]):
     """Error result variant.
 
@@ -832,12 +1026,47 @@ class Err(Result[A, E]):
     __slots__ = ("value",)
     __match_args__ = ("value",)
 
-    def __init__(self, value: E) -> None:
-        self.value: E = value
+    if TYPE_CHECKING:
+
+        @property
+        def status(self) -> Literal["err"]: ...
+
+    else:
+        status = "err"
+
+    value: E
+
+    def __class_getitem__(cls, item: object) -> type:
+        # See Ok.__class_getitem__: skips _GenericAlias construction and
+        # the suppressed __orig_class__ store on parameterized construction
+        return cls
+
+    def __new__(cls, value: E) -> "Err[A, E]":
+        # Flyweight for the common empty-error payload; subclasses skip
+        # the cache so their identity semantics stay untouched
+        if cls is Err and value is None:
+            return cast("Err[A, E]", _ERR_NONE)
+        # Assigning here instead of in __init__ saves type.__call__ a
+        # second Python frame per construction (object.__init__ accepts
+        # the extra argument because __new__ is overridden)
+        obj = cast("Err[A, E]", object.__new__(cls))
+        obj.value = value
+        return obj
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_err(self) -> bool:
+        return True
 
-    @property
-    def status(self) -> Literal["err"]:
-        return "err"
+    def __bool__(self) -> Literal[False]:
+        """Err is always falsy, so `if result:` branches on success.
+
+        Example:
+            >>> bool(Err("fail"))
+            False
+        """
+        return False
 
     def map(self, fn: Callable[[A], B]) -> "Err[B, E]":
         """No-op on Err, returns self with new phantom T.
@@ -848,7 +1077,19 @@ class Err(Result[A, E]):
         Returns:
             Self.
         """
-        return cast("Err[B, E]", self)
+        # typing.cast is a runtime call; A is phantom so self is returned as-is
+        return self  # type: ignore[return-value]
+
+    def map_chain(self, *fns: Callable[[Any], Any]) -> "Err[Any, E]":
+        """No-op on Err, returns self with new phantom T.
+
+        Args:
+            *fns: Ignored.
+
+        Returns:
+            Self.
+        """
+        return self
 
     def map_err(self, fn: Callable[[E], F]) -> "Err[A, F]":
         """Transforms error value.
@@ -866,7 +1107,10 @@ class Err(Result[A, E]):
             >>> Err("fail").map_err(lambda e: f"Error: {e}")
             Err("Error: fail")
         """
-        return try_or_panic(lambda: Err(fn(self.value)), "Err.map_err failed")
+        try:
+            return Err(fn(self.value))
+        except Exception as e:
+            panic("Err.map_err failed", e)
 
     def unwrap(self, message: Optional[str] = None) -> NoReturn:
         """Panics with optional message.
@@ -944,7 +1188,7 @@ class Err(Result[A, E]):
         Returns:
             Self.
         """
-        return try_or_panic(lambda: cast("Err[A, E]", self), "Err.and_then failed")
+        return self
 
     async def and_then_async(
         self, fn: Callable[[A], Awaitable[Result[B, F]]]
@@ -957,15 +1201,15 @@ class Err(Result[A, E]):
         Returns:
             Self.
         """
-        return try_or_panic(
-            lambda: cast("Err[A, E]", self), "Err.and_then_async failed"
-        )
+        return self
 
-    def match(self, cases: Matcher[A, B, E, F]) -> B | F:
+    def match(
+        self, cases: "Matcher[A, B, E, F] | CompiledMatcher[A, B, E, F]"
+    ) -> B | F:
         """Pattern matches on Result.
 
         Args:
-            cases: Ok and err handlers.
+            cases: Ok and err handlers (Matcher dict or CompiledMatcher).
 
         Returns:
             Result of err handler.
@@ -977,11 +1221,13 @@ class Err(Result[A, E]):
             >>> Err("fail").match({"ok": lambda x: x, "err": lambda e: len(e)})
             4
         """
-
-        def call_handler() -> B | F:
-            return cases["err"](self.value)
-
-        return try_or_panic(call_handler, "Err.match failed")
+        try:
+            if type(cases) is CompiledMatcher:
+                return cases.err(self.value)
+            # cast: see Ok.match — the identity check doesn't narrow here
+            return cast("Matcher[A, B, E, F]", cases)["err"](self.value)
+        except Exception as e:
+            panic("Err.match failed", e)
 
     def serialize(self) -> SerializedErr[E]:
         """Converts to plain dict for serialization.
@@ -993,23 +1239,56 @@ class Err(Result[A, E]):
             >>> Err("fail").serialize()
             {'status': 'err', 'value': 'fail'}
         """
-        value = str(self.value) if isinstance(self.value, Exception) else self.value
-        return SerializedErr(status="err", value=value)
+        # TypedDict is typing-only; a dict literal skips the kwarg unpacking
+        value = self.value
+        if type(value) is str or not isinstance(value, Exception):
+            return {"status": "err", "value": value}
+        return {"status": "err", "value": str(value)}
+
+    _TAG_HASH = hash("err")
 
     def __repr__(self) -> str:
         return f"Err({self.value!r})"
 
     def __hash__(self) -> int:
-        return hash(("err", self.value))
+        # XOR with the precomputed tag hash; skips a tuple allocation per call
+        return Err._TAG_HASH ^ hash(self.value)
 
     def __str__(self) -> str:
         return f"Err({self.value!r})"
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Err):
-            return False
-        other_err = cast("Err[A, E]", other)
-        return self.value == other_err.value
+        return self is other or (
+            type(other) is Err and self.value == cast("Err[A, E]", other).value
+        )
+
+
+def _intern_err(value: object) -> "Err[Any, Any]":
+    # Built with object.__new__ so the flyweight lookup in Err.__new__ is
+    # bypassed while the shared instance is being created
+    err = cast("Err[Any, Any]", object.__new__(Err))
+    err.value = value
+    return err
+
+
+"""
+Shared flyweight instance for the empty Err payload.
+"""
+_ERR_NONE = _intern_err(None)
+
+
+# The variant classes are themselves the constructors: binding them directly
+# removes the staticmethod descriptor + wrapper frame from Result.ok(v) /
+# Result.err(e), which hydrate/hydrate_as pay on every deserialization.
+Result.ok = Ok  # type: ignore[assignment]
+Result.err = Err  # type: ignore[assignment]
+
+"""
+Bare constructor aliases. ok(v)/err(e) skip even the class-attribute
+lookup that Result.ok(v)/Result.err(e) pay.
+"""
+ok = Ok
+err = Err
 
 
 @overload
@@ -1042,10 +1321,12 @@ def map(
         >>> mapper(Ok(2))
         Ok(4)
     """
-    if fn is None:
-        _fn = cast(Callable[[A], B], result)
-        return lambda r: try_or_panic(lambda: r.map(_fn), "map failed")
-    return try_or_panic(lambda: cast(Result[A, E], result).map(fn), "map failed")
+    # Data-first is the common call shape; test it first so the hot path
+    # pays one branch and no closure allocation
+    if fn is not None:
+        return cast(Result[A, E], result).map(fn)
+    _fn = cast(Callable[[A], B], result)
+    return lambda r: r.map(_fn)
 
 
 @overload
@@ -1075,12 +1356,12 @@ def map_err(
         >>> map_err(Err("fail"), lambda e: f"Error: {e}")
         Err("Error: fail")
     """
-    if fn is None:
-        _fn = cast(Callable[[E], F], result)
-        return lambda r: try_or_panic(lambda: r.map_err(_fn), "map_err failed")
-    return try_or_panic(
-        lambda: cast(Result[A, E], result).map_err(fn), "map_err failed"
-    )
+    # Data-first is the common call shape; test it first so the hot path
+    # pays one branch and no closure allocation
+    if fn is not None:
+        return cast(Result[A, E], result).map_err(fn)
+    _fn = cast(Callable[[E], F], result)
+    return lambda r: r.map_err(_fn)
 
 
 @overload
@@ -1113,8 +1394,8 @@ def tap(
     """
     if fn is None:
         _fn = cast(Callable[[A], None], result)
-        return lambda r: try_or_panic(lambda: r.tap(_fn), "tap failed")
-    return try_or_panic(lambda: cast(Result[A, E], result).tap(fn), "tap failed")
+        return lambda r: r.tap(_fn)
+    return cast(Result[A, E], result).tap(fn)
 
 
 @overload
@@ -1153,12 +1434,8 @@ def tap_async(
     """
     if fn is None:
         _fn = cast(Callable[[A], Awaitable[None]], result)
-        return lambda r: try_or_panic_async(
-            lambda: r.tap_async(_fn), "tap_async failed"
-        )
-    return try_or_panic_async(
-        lambda: cast(Result[A, E], result).tap_async(fn), "tap_async failed"
-    )
+        return lambda r: r.tap_async(_fn)
+    return cast(Result[A, E], result).tap_async(fn)
 
 
 def unwrap(result: Result[A, E], message: Optional[str] = None) -> A:
@@ -1214,22 +1491,8 @@ def and_then(
     """
     if fn is None:
         _fn = cast(Callable[[A], Result[B, F]], result)
-        return lambda r: cast(
-            Result[B, E | F],
-            try_or_panic(
-                lambda: r.and_then(cast(Callable[[A], Result[B, E]], _fn)),
-                "and_then failed",
-            ),
-        )
-    return cast(
-        Result[B, E | F],
-        try_or_panic(
-            lambda: cast(Result[A, E], result).and_then(
-                cast(Callable[[A], Result[B, E]], fn)
-            ),
-            "and_then failed",
-        ),
-    )
+        return lambda r: r.and_then(_fn)
+    return cast(Result[A, E], result).and_then(fn)
 
 
 @overload
@@ -1269,38 +1532,29 @@ def and_then_async(
     if fn is None:
         _fn = cast(Callable[[A], Awaitable[Result[B, F]]], result)
         return lambda r: cast(
-            Coroutine[None, None, Result[B, E | F]],
-            try_or_panic_async(
-                lambda: r.and_then_async(
-                    cast(Callable[[A], Awaitable[Result[B, E]]], _fn)
-                ),
-                "and_then_async failed",
-            ),
+            Coroutine[None, None, Result[B, E | F]], r.and_then_async(_fn)
         )
     return cast(
         Coroutine[None, None, Result[B, E | F]],
-        try_or_panic_async(
-            lambda: cast(Result[A, E], result).and_then_async(
-                cast(Callable[[A], Awaitable[Result[B, E]]], fn)
-            ),
-            "and_then_async failed",
-        ),
+        cast(Result[A, E], result).and_then_async(fn),
     )
 
 
 @overload
 def match(
-    result: Matcher[A, B, E, B],
+    result: Matcher[A, B, E, B] | CompiledMatcher[A, B, E, B],
 ) -> Callable[[Result[A, E]], B]: ...
 
 
 @overload
-def match(result: Result[A, E], handlers: Matcher[A, B, E, B]) -> B: ...
+def match(
+    result: Result[A, E], handlers: Matcher[A, B, E, B] | CompiledMatcher[A, B, E, B]
+) -> B: ...
 
 
 def match(
-    result: Result[A, E] | Matcher[A, B, E, B],
-    handlers: Matcher[A, B, E, B] | None = None,
+    result: Result[A, E] | Matcher[A, B, E, B] | CompiledMatcher[A, B, E, B],
+    handlers: Matcher[A, B, E, B] | CompiledMatcher[A, B, E, B] | None = None,
 ) -> B | Callable[[Result[A, E]], B]:
     """Pattern matches on Result.
 
@@ -1318,19 +1572,11 @@ def match(
         4
     """
     if handlers is None:
-        _handlers = cast(Matcher[A, B, E, B], result)
-
-        def apply_match(r: Result[A, E]) -> B:
-            return try_or_panic(lambda: r.match(_handlers), "match failed")
-
-        return apply_match
-
-    def apply_handlers() -> B:
-        return try_or_panic(
-            lambda: cast(Result[A, E], result).match(handlers), "match failed"
+        _handlers = cast(
+            "Matcher[A, B, E, B] | CompiledMatcher[A, B, E, B]", result
         )
-
-    return apply_handlers()
+        return lambda r: r.match(_handlers)
+    return cast(Result[A, E], result).match(handlers)
 
 
 def try_or_panic(fn: Callable[[], A], message: str) -> A:
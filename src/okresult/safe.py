@@ -131,6 +131,38 @@ class SafeOptions(TypedDict, Generic[A, E]):
     catch: Callable[[Exception], E]
 
 
+def _execute(
+    try_: Callable[[], A], catch: Callable[[Exception], E] | None
+) -> Result[A, E | UnhandledException]:
+    """Runs one safe attempt; shared by the no-retry and retry paths."""
+    try:
+        return Ok(try_())
+    except Exception as original_cause:
+        if catch is None:
+            return Err(UnhandledException(original_cause))
+        # If the user's catch handler throws, it's a defect — Panic
+        try:
+            return Err(catch(original_cause))
+        except Exception as catch_handler_error:
+            panic("Result.safe catch handler threw", catch_handler_error)
+
+
+async def _execute_async(
+    try_: Callable[[], Awaitable[A]], catch: Callable[[Exception], E] | None
+) -> Result[A, E | UnhandledException]:
+    """Runs one safe_async attempt; shared by the no-retry and retry paths."""
+    try:
+        return Ok(await try_())
+    except Exception as original_cause:
+        if catch is None:
+            return Err(UnhandledException(original_cause))
+        # If the user's catch handler throws, it's a defect — Panic
+        try:
+            return Err(catch(original_cause))
+        except Exception as catch_handler_error:
+            panic("Result.safe_async catch handler threw", catch_handler_error)
+
+
 @overload
 def safe(
     thunk: Callable[[], A],
@@ -168,43 +200,41 @@ def safe(
         Err("error")
     """
 
-    def execute() -> Result[A, E | UnhandledException]:
-        if callable(thunk):
-            try:
-                return Ok(thunk())
-            except Exception as e:
-                return Err(UnhandledException(e))
-        else:
-            try:
-                return Ok(thunk["try_"]())
-            except Exception as original_cause:
-                # If the user's catch handler throws, it's a defect — Panic
-                try:
-                    return Err(thunk["catch"](original_cause))
-                except Exception as catch_handler_error:
-                    panic("Result.safe catch handler threw", catch_handler_error)
+    # Pick the execution shape once; _execute is module-level so no closure
+    # is allocated per call
+    if callable(thunk):
+        _try: Callable[[], A] = thunk
+        _catch: Callable[[Exception], E] | None = None
+    else:
+        _try = thunk["try_"]
+        _catch = thunk["catch"]
 
+    # Common path: no retry configured — skip the loop setup entirely
     retry_config: RetryConfig[E] | None = (
-        config["retry"] if config is not None and "retry" in config else None
-    )
-    times: int = (
-        retry_config["times"] if retry_config and "times" in retry_config else 0
+        config.get("retry") if config is not None else None
     )
+    times: int = retry_config.get("times", 0) if retry_config else 0
+    if times == 0:
+        return _execute(_try, _catch)
 
     def _always_retry(_: E) -> bool:
         return True
 
-    should_retry_fn: ShouldRetryCallable[E] | None = (
-        retry_config["should_retry"]
-        if retry_config and "should_retry" in retry_config
-        else None
+    should_retry: ShouldRetryCallable[E] = (
+        retry_config.get("should_retry") or _always_retry
+        if retry_config
+        else _always_retry
     )
-    should_retry: ShouldRetryCallable[E] = should_retry_fn or _always_retry
 
-    result = execute()
+    # Annotated so the type(result) is Ok narrowing below keeps the
+    # declared parameters instead of decaying to Ok[Unknown, Unknown]
+    result: Result[A, E | UnhandledException] = _execute(_try, _catch)
 
     for _ in range(times):
-        if result.is_ok():
+        # type() is a single pointer compare; avoids a method call per iteration
+        if type(result) is Ok:
+            # cast: type() narrowing erases the Ok parameters
+            result = cast(Result[A, E | UnhandledException], result)
             break
         error = result.unwrap_err()
         should_continue = try_or_panic(
@@ -212,7 +242,7 @@ def safe(
         )
         if not should_continue:
             break
-        result = execute()
+        result = _execute(_try, _catch)
 
     return result
 
@@ -258,21 +288,14 @@ async def safe_async(
         ... )
     """
 
-    async def execute() -> Result[A, E | UnhandledException]:
-        if callable(thunk):
-            try:
-                return Ok(await thunk())
-            except Exception as e:
-                return Err(UnhandledException(e))
-        else:
-            try:
-                return Ok(await thunk["try_"]())
-            except Exception as original_cause:
-                # If the user's catch handler throws, it's a defect — Panic
-                try:
-                    return Err(thunk["catch"](original_cause))
-                except Exception as catch_handler_error:
-                    panic("Result.safe_async catch handler threw", catch_handler_error)
+    # Pick the execution shape once; _execute_async is module-level so no
+    # closure is allocated per call
+    if callable(thunk):
+        _try: Callable[[], Awaitable[A]] = thunk
+        _catch: Callable[[Exception], E] | None = None
+    else:
+        _try = thunk["try_"]
+        _catch = thunk["catch"]
 
     def get_delay(attempt: int, retry_config: RetryConfigAsync[E] | None) -> float:
         if not retry_config:
@@ -286,27 +309,30 @@ async def safe_async(
         else:  # exponential
             return (delay_ms * (2**attempt)) / 1000
 
+    # Common path: no retry configured — skip the loop setup entirely
     retry_config: RetryConfigAsync[E] | None = (
-        config["retry"] if config is not None and "retry" in config else None
-    )
-    times: int = (
-        retry_config["times"] if retry_config and "times" in retry_config else 0
+        config.get("retry") if config is not None else None
     )
+    times: int = retry_config.get("times", 0) if retry_config else 0
+    if times == 0:
+        return await _execute_async(_try, _catch)
 
     def _always_retry(_: E) -> bool:
         return True
 
-    should_retry_fn: ShouldRetryAsyncCallable[E] | None = (
-        retry_config["should_retry"]
-        if retry_config and "should_retry" in retry_config
-        else None
+    should_retry: ShouldRetryAsyncCallable[E] = (
+        retry_config.get("should_retry") or _always_retry
+        if retry_config
+        else _always_retry
     )
-    should_retry: ShouldRetryAsyncCallable[E] = should_retry_fn or _always_retry
 
-    result = await execute()
+    result = await _execute_async(_try, _catch)
 
     for attempt in range(times):
-        if result.is_ok():
+        # type() is a single pointer compare; avoids a method call per iteration
+        if type(result) is Ok:
+            # cast: type() narrowing erases the Ok parameters
+            result = cast(Result[A, E | UnhandledException], result)
             break
         error = result.unwrap_err()
 
@@ -324,6 +350,6 @@ async def safe_async(
         delay = get_delay(attempt, retry_config)
         if delay > 0:
             await asyncio.sleep(delay)
-        result = await execute()
+        result = await _execute_async(_try, _catch)
 
     return result
@@ -0,0 +1,37 @@
+from typing import Awaitable, Callable
+
+import pytest
+
+from okresult import Err, Ok, Result
+
+CaptureAsync = tuple[Callable[[int], Awaitable[None]], Callable[[], int]]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_result() -> None:
+    """Realizes first-call costs (flyweight cache, specializing
+    interpreter warm-up) once per session so individual tests measure
+    steady-state behavior."""
+    Result.ok(0)
+    Result.err("x")
+    Ok(0).map(lambda x: x)
+    Err("x").map_err(lambda e: e)
+
+
+@pytest.fixture
+def async_capture() -> CaptureAsync:
+    """Reusable async side-effect capturer for tap_async tests.
+
+    Returns a (capture, captured) pair; capture stores the value it was
+    called with in a list cell and captured reads it back, so tests skip
+    the per-test nonlocal closure definition.
+    """
+    cell: list[int] = [0]
+
+    async def capture(x: int) -> None:
+        cell[0] = x
+
+    def captured() -> int:
+        return cell[0]
+
+    return capture, captured
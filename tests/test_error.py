@@ -1,6 +1,8 @@
 from okresult import TaggedError, UnhandledException, fn
 from typing import TypeAlias, Union
 
+import pytest
+
 
 class NotFoundError(TaggedError):
     __slots__ = ("id",)
@@ -197,6 +199,69 @@ class TestTaggedError:
             error = NotHandledError()
             assert match_app_error_partial(error) == "Unknown error: Not handled"
 
+    class TestCompileMatchPartial:
+        def test_dispatches_to_matching_handler(self) -> None:
+            dispatch = TaggedError.compile_match_partial(
+                {NotFoundError: fn[NotFoundError, str](lambda e: f"Not found: {e.id}")},
+                handle_otherwise,
+            )
+
+            assert dispatch(NotFoundError("123")) == "Not found: 123"
+
+        def test_falls_back_for_unhandled_type(self) -> None:
+            dispatch = TaggedError.compile_match_partial(
+                {NotFoundError: fn[NotFoundError, str](lambda e: "handled")},
+                handle_otherwise,
+            )
+
+            assert dispatch(NotHandledError()) == "Unknown error: Not handled"
+
+    class TestCompileMatch:
+        def test_dispatches_to_matching_handler(self) -> None:
+            dispatch = TaggedError.compile_match(
+                {
+                    NotFoundError: fn[NotFoundError, str](
+                        lambda e: f"Not found: {e.id}"
+                    ),
+                    ValidationError: fn[ValidationError, str](
+                        lambda e: f"Invalid field: {e.field}"
+                    ),
+                }
+            )
+
+            assert dispatch(NotFoundError("123")) == "Not found: 123"
+            assert dispatch(ValidationError("name")) == "Invalid field: name"
+
+        def test_base_class_handler_matches_subclasses(self) -> None:
+            dispatch = TaggedError.compile_match(
+                {TaggedError: fn[TaggedError, str](lambda e: f"caught: {e.message}")}
+            )
+
+            assert dispatch(NetworkError("https://example.com")) == (
+                "caught: Network error: https://example.com"
+            )
+
+        def test_resolves_subclasses_defined_after_compilation(self) -> None:
+            dispatch = TaggedError.compile_match(
+                {NotFoundError: fn[NotFoundError, str](lambda e: "handled")}
+            )
+
+            class LateNotFoundError(NotFoundError):
+                __slots__ = ()
+
+                TAG: str = "LateNotFoundError"
+
+            assert dispatch(LateNotFoundError("123")) == "handled"
+
+        def test_throws_for_uncovered_error_type(self) -> None:
+            dispatch = TaggedError.compile_match(
+                {NotFoundError: fn[NotFoundError, str](lambda e: "handled")}
+            )
+
+            with pytest.raises(ValueError) as exc_info:
+                dispatch(NotHandledError())
+            assert "No handler for error type" in str(exc_info.value)
+
 
 class TestUnhandledException:
     def test_wraps_exception_cause(self) -> None: